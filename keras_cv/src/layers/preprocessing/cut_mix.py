@@ -46,14 +46,19 @@ class CutMix(BaseImageAugmentationLayer):
         super().__init__(seed=seed, **kwargs)
         self.alpha = alpha
         self.seed = seed
+        # Beta(1, 1) is Uniform(0, 1), which avoids two gamma draws.
+        self._beta_is_uniform = alpha == 1.0
 
     def _sample_from_beta(self, alpha, beta, shape):
-        sample_alpha = tf.random.gamma(
+        seeds = self._random_generator.make_seeds(2)
+        sample_alpha = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 0],
             alpha=alpha,
         )
-        sample_beta = tf.random.gamma(
+        sample_beta = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 1],
             alpha=beta,
         )
         return sample_alpha / (sample_alpha + sample_beta)
@@ -111,26 +116,36 @@ class CutMix(BaseImageAugmentationLayer):
             input_shape[2],
         )
 
-        permutation_order = tf.random.shuffle(
-            tf.range(0, batch_size), seed=self.seed
+        # Pair every sample with another one by a random cyclic shift, which
+        # avoids a full shuffle and never pairs a sample with itself.
+        shift = self._random_generator.uniform(
+            shape=(),
+            minval=1,
+            maxval=tf.maximum(batch_size, 2),
+            dtype=tf.int32,
         )
-        lambda_sample = self._sample_from_beta(
-            self.alpha, self.alpha, (batch_size,)
+        permutation_order = tf.math.floormod(
+            tf.range(0, batch_size) + shift, batch_size
         )
+        if self._beta_is_uniform:
+            lambda_sample = self._random_generator.uniform(shape=(batch_size,))
+        else:
+            lambda_sample = self._sample_from_beta(
+                self.alpha, self.alpha, (batch_size,)
+            )
 
         ratio = tf.math.sqrt(1 - lambda_sample)
 
-        cut_height = tf.cast(
-            ratio * tf.cast(image_height, dtype=tf.float32), dtype=tf.int32
-        )
-        cut_width = tf.cast(
-            ratio * tf.cast(image_width, dtype=tf.float32), dtype=tf.int32
+        image_dims = tf.cast(
+            tf.stack([image_height, image_width]), dtype=tf.float32
         )
+        cut_dims = tf.cast(ratio[:, None] * image_dims, dtype=tf.int32)
+        cut_height, cut_width = cut_dims[:, 0], cut_dims[:, 1]
 
-        random_center_height = tf.random.uniform(
+        random_center_height = self._random_generator.uniform(
             shape=[batch_size], minval=0, maxval=image_height, dtype=tf.int32
         )
-        random_center_width = tf.random.uniform(
+        random_center_width = self._random_generator.uniform(
             shape=[batch_size], minval=0, maxval=image_width, dtype=tf.int32
         )
 
@@ -161,7 +176,7 @@ class CutMix(BaseImageAugmentationLayer):
         cutout_labels = tf.gather(labels, permutation_order)
 
         lambda_sample = tf.reshape(lambda_sample, [-1, 1])
-        labels = lambda_sample * labels + (1.0 - lambda_sample) * cutout_labels
+        labels = cutout_labels + lambda_sample * (labels - cutout_labels)
 
         return labels
 
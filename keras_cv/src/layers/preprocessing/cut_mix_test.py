@@ -81,6 +81,25 @@ class CutMixTest(TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_cut_mix_call_results_with_non_uniform_alpha(self):
+        xs = tf.cast(
+            tf.stack(
+                [2 * tf.ones((4, 4, 3)), tf.ones((4, 4, 3))],
+                axis=0,
+            ),
+            tf.float32,
+        )
+        ys = tf.one_hot(tf.constant([0, 1]), 2)
+
+        layer = CutMix(alpha=0.5, seed=1)
+        outputs = layer({"images": xs, "labels": ys})
+        xs, ys = outputs["images"], outputs["labels"]
+
+        self.assertEqual(xs.shape, (2, 4, 4, 3))
+        self.assertEqual(ys.shape, (2, 2))
+        # Mixed labels should still sum to one
+        self.assertAllClose(ops.sum(ys, axis=-1), [1.0, 1.0])
+
     def test_cut_mix_call_results_one_channel_with_labels(self):
         xs = tf.cast(
             tf.stack(
@@ -231,6 +250,26 @@ class CutMixTest(TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_same_seed_gives_same_results(self):
+        xs = tf.random.uniform((4, 8, 8, 3))
+        ys = tf.one_hot(tf.constant([0, 1, 2, 3]), 4)
+
+        outputs = CutMix(alpha=0.5, seed=1)({"images": xs, "labels": ys})
+        other_outputs = CutMix(alpha=0.5, seed=1)({"images": xs, "labels": ys})
+
+        self.assertAllClose(outputs["images"], other_outputs["images"])
+        self.assertAllClose(outputs["labels"], other_outputs["labels"])
+
+    def test_batch_of_one(self):
+        xs = tf.ones((1, 8, 8, 3))
+        ys = tf.one_hot(tf.constant([1]), 2)
+
+        layer = CutMix(seed=1)
+        outputs = layer({"images": xs, "labels": ys})
+
+        self.assertAllClose(outputs["images"], xs)
+        self.assertAllClose(outputs["labels"], ys)
+
     def test_single_image_input(self):
         xs = tf.ones((512, 512, 3))
         ys = tf.one_hot(tf.constant([1]), 2)
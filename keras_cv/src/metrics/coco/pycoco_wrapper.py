@@ -120,29 +120,41 @@ def _yxyx_to_xywh(boxes):
     return new_boxes
 
 
+def _valid_instances_mask(num_instances, max_num_instances):
+    """Returns a [batch_size, max_num_instances] mask of non-padded entries."""
+    num_instances = np.asarray(num_instances)
+    instance_indices = np.arange(max_num_instances)
+    return instance_indices[np.newaxis, :] < num_instances[:, np.newaxis]
+
+
 def _convert_predictions_to_coco_annotations(predictions):
     coco_predictions = []
     num_batches = len(predictions["source_id"])
     for i in range(num_batches):
-        batch_size = predictions["source_id"][i].shape[0]
-        predictions["detection_boxes"][i] = predictions["detection_boxes"][
-            i
-        ].copy()
-        for j in range(batch_size):
-            max_num_detections = predictions["num_detections"][i][j]
-            predictions["detection_boxes"][i][j] = _yxyx_to_xywh(
-                predictions["detection_boxes"][i][j]
-            )
-            for k in range(max_num_detections):
-                ann = {}
-                ann["image_id"] = predictions["source_id"][i][j]
-                ann["category_id"] = predictions["detection_classes"][i][j][k]
-                ann["bbox"] = predictions["detection_boxes"][i][j][k]
-                ann["score"] = predictions["detection_scores"][i][j][k]
-                coco_predictions.append(ann)
-
-    for i, ann in enumerate(coco_predictions):
-        ann["id"] = i + 1
+        detection_boxes = _yxyx_to_xywh(
+            np.asarray(predictions["detection_boxes"][i])
+        )
+        # Gather the detections of every image in the batch at once.
+        is_valid = _valid_instances_mask(
+            predictions["num_detections"][i], detection_boxes.shape[1]
+        )
+        source_ids = np.asarray(predictions["source_id"][i])
+        image_ids = np.broadcast_to(source_ids[:, np.newaxis], is_valid.shape)
+        detection_classes = np.asarray(predictions["detection_classes"][i])
+        detection_scores = np.asarray(predictions["detection_scores"][i])
+        for image_id, category_id, bbox, score in zip(
+            image_ids[is_valid],
+            detection_classes[is_valid],
+            detection_boxes[is_valid],
+            detection_scores[is_valid],
+        ):
+            ann = {}
+            ann["image_id"] = image_id
+            ann["category_id"] = category_id
+            ann["bbox"] = bbox
+            ann["score"] = score
+            ann["id"] = len(coco_predictions) + 1
+            coco_predictions.append(ann)
 
     return coco_predictions
 
@@ -154,32 +166,31 @@ def _convert_groundtruths_to_coco_dataset(groundtruths, label_map=None):
     gt_annotations = []
     num_batches = len(groundtruths["source_id"])
     for i in range(num_batches):
-        max_num_instances = max(x.shape[0] for x in groundtruths["classes"][i])
-        batch_size = groundtruths["source_id"][i].shape[0]
-        for j in range(batch_size):
-            num_instances = groundtruths["num_detections"][i][j]
-            if num_instances > max_num_instances:
-                num_instances = max_num_instances
-            for k in range(int(num_instances)):
-                ann = {}
-                ann["image_id"] = groundtruths["source_id"][i][j]
-                ann["iscrowd"] = 0
-                ann["category_id"] = int(groundtruths["classes"][i][j][k])
-                boxes = groundtruths["boxes"][i]
-                ann["bbox"] = [
-                    float(boxes[j][k][1]),
-                    float(boxes[j][k][0]),
-                    float(boxes[j][k][3] - boxes[j][k][1]),
-                    float(boxes[j][k][2] - boxes[j][k][0]),
-                ]
-                ann["area"] = float(
-                    (boxes[j][k][3] - boxes[j][k][1])
-                    * (boxes[j][k][2] - boxes[j][k][0])
-                )
-                gt_annotations.append(ann)
-
-    for i, ann in enumerate(gt_annotations):
-        ann["id"] = i + 1
+        boxes = _yxyx_to_xywh(np.asarray(groundtruths["boxes"][i]))
+        areas = boxes[..., 2] * boxes[..., 3]
+        # Gather the instances of every image in the batch at once.
+        is_valid = _valid_instances_mask(
+            groundtruths["num_detections"][i], boxes.shape[1]
+        )
+        batch_source_ids = np.asarray(groundtruths["source_id"][i])
+        image_ids = np.broadcast_to(
+            batch_source_ids[:, np.newaxis], is_valid.shape
+        )
+        classes = np.asarray(groundtruths["classes"][i])
+        for image_id, category_id, bbox, area in zip(
+            image_ids[is_valid],
+            classes[is_valid],
+            boxes[is_valid],
+            areas[is_valid],
+        ):
+            ann = {}
+            ann["image_id"] = image_id
+            ann["iscrowd"] = 0
+            ann["category_id"] = int(category_id)
+            ann["bbox"] = [float(x) for x in bbox]
+            ann["area"] = float(area)
+            ann["id"] = len(gt_annotations) + 1
+            gt_annotations.append(ann)
 
     if label_map:
         gt_categories = [{"id": i, "name": label_map[i]} for i in label_map]
@@ -190,7 +201,7 @@ def _convert_groundtruths_to_coco_dataset(groundtruths, label_map=None):
     gt_dataset = {
         "images": gt_images,
         "categories": gt_categories,
-        "annotations": copy.deepcopy(gt_annotations),
+        "annotations": gt_annotations,
     }
     return gt_dataset
 
@@ -230,10 +241,8 @@ def compute_pycoco_metrics(groundtruths, predictions):
     coco_eval.summarize()
     coco_metrics = coco_eval.stats
 
-    metrics = coco_metrics
-
     metrics_dict = {}
     for i, name in enumerate(METRIC_NAMES):
-        metrics_dict[name] = metrics[i].astype(np.float32)
+        metrics_dict[name] = coco_metrics[i].astype(np.float32)
 
     return metrics_dict
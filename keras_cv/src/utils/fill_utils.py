@@ -13,15 +13,11 @@
 # limitations under the License.
 import tensorflow as tf
 
-from keras_cv.src import bounding_box
-
 
 def _axis_mask(starts, ends, mask_len):
-    # index range of axis
-    batch_size = tf.shape(starts)[0]
+    # index range of axis, broadcast against the per-sample bounds
     axis_indices = tf.range(mask_len, dtype=starts.dtype)
     axis_indices = tf.expand_dims(axis_indices, 0)
-    axis_indices = tf.tile(axis_indices, [batch_size, 1])
 
     # mask of index bounds
     axis_mask = tf.greater_equal(axis_indices, starts) & tf.less(
@@ -72,13 +68,22 @@ def fill_rectangle(images, centers_x, centers_y, widths, heights, fill_values):
     images_height = images_shape[1]
     images_width = images_shape[2]
 
-    xywh = tf.stack([centers_x, centers_y, widths, heights], axis=1)
-    xywh = tf.cast(xywh, tf.float32)
-    corners = bounding_box.convert_format(
-        xywh, source="center_xywh", target="xyxy"
+    # compare pixel indices directly against the rectangle bounds rather
+    # than round-tripping through a stacked bounding box tensor
+    centers_x = tf.expand_dims(tf.cast(centers_x, tf.float32), -1)
+    centers_y = tf.expand_dims(tf.cast(centers_y, tf.float32), -1)
+    half_widths = tf.expand_dims(tf.cast(widths, tf.float32), -1) / 2.0
+    half_heights = tf.expand_dims(tf.cast(heights, tf.float32), -1) / 2.0
+
+    w_mask = _axis_mask(
+        centers_x - half_widths, centers_x + half_widths, images_width
+    )
+    h_mask = _axis_mask(
+        centers_y - half_heights, centers_y + half_heights, images_height
+    )
+    is_rectangle = tf.logical_and(
+        tf.expand_dims(w_mask, axis=1), tf.expand_dims(h_mask, axis=2)
     )
-    mask_shape = (images_width, images_height)
-    is_rectangle = corners_to_mask(corners, mask_shape)
     is_rectangle = tf.expand_dims(is_rectangle, -1)
 
     images = tf.where(is_rectangle, fill_values, images)